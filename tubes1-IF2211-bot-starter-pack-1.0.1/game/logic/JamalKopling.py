@@ -70,19 +70,22 @@ class GreedyJamalLogic(BaseLogic):
         step_x = 1 if dx > 0 else -1 if dx < 0 else 0
         step_y = 1 if dy > 0 else -1 if dy < 0 else 0
 
+        table = board.move_table
+        x, y = start.x, start.y
+
         if abs(dx) >= abs(dy):
-            if board.is_valid_move(start, step_x, 0):
+            if table.is_legal(x, y, step_x, 0):
                 return (step_x, 0)
-            elif step_y != 0 and board.is_valid_move(start, 0, step_y):
+            elif step_y != 0 and table.is_legal(x, y, 0, step_y):
                 return (0, step_y)
         else:
-            if board.is_valid_move(start, 0, step_y):
+            if table.is_legal(x, y, 0, step_y):
                 return (0, step_y)
-            elif step_x != 0 and board.is_valid_move(start, step_x, 0):
+            elif step_x != 0 and table.is_legal(x, y, step_x, 0):
                 return (step_x, 0)
 
         for dx, dy in [(1,0), (0,1), (-1,0), (0,-1)]:
-            if board.is_valid_move(start, dx, dy):
+            if table.is_legal(x, y, dx, dy):
                 return (dx, dy)
 
         return (0, 0)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from functools import cached_property
+from typing import Dict, List, Optional, Union
 from colorama import Fore, Style
+from game.move_table import MoveTable, get_move_table
 
 
 @dataclass
@@ -76,6 +78,38 @@ class Board:
     def diamonds(self) -> List[GameObject]:
         return [d for d in self.game_objects if d.type == "DiamondGameObject"]
 
+    @property
+    def teleporters(self) -> List[GameObject]:
+        return [d for d in self.game_objects if d.type == "TeleportGameObject"]
+
+    @property
+    def move_table(self) -> MoveTable:
+        return get_move_table(self.width, self.height)
+
+    @cached_property
+    def teleport_cells(self) -> Dict[int, int]:
+        """
+        Map from a teleporter's cell index to the cell index of its pair.
+        Built once per board snapshot; fetch it once before a search loop
+        rather than on every expansion.
+        """
+        pairs: Dict[Optional[str], List[GameObject]] = {}
+        for t in self.teleporters:
+            pair_id = t.properties.pair_id if t.properties else None
+            # The game always pairs teleporters; skip malformed ones
+            if pair_id is not None:
+                pairs.setdefault(pair_id, []).append(t)
+
+        table = self.move_table
+        cells: Dict[int, int] = {}
+        for group in pairs.values():
+            if len(group) != 2:
+                continue
+            a, b = group[0].position, group[1].position
+            cells[table.index(a.x, a.y)] = table.index(b.x, b.y)
+            cells[table.index(b.x, b.y)] = table.index(a.x, a.y)
+        return cells
+
     def get_bot(self, bot: Bot) -> Optional[GameObject]:
         for b in self.bots:
             if b.properties.name == bot.name:
@@ -85,6 +119,11 @@ class Board:
     def is_valid_move(
         self, current_position: Position, delta_x: int, delta_y: int
     ) -> bool:
+        if self.move_table.is_legal(
+            current_position.x, current_position.y, delta_x, delta_y
+        ):
+            return True
+
         if not (-1 <= delta_x <= 1) or not (-1 <= delta_y <= 1):
             print(
                 Fore.RED + Style.BRIGHT + "Invalid move:" + Style.RESET_ALL,
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# One bit per direction, set in a cell's mask when the step stays on the board
+EAST = 1
+SOUTH = 2
+WEST = 4
+NORTH = 8
+
+DIRECTIONS: Tuple[Tuple[int, int, int], ...] = (
+    (EAST, 1, 0),
+    (SOUTH, 0, 1),
+    (WEST, -1, 0),
+    (NORTH, 0, -1),
+)
+
+_BITS: Dict[Tuple[int, int], int] = {(dx, dy): bit for bit, dx, dy in DIRECTIONS}
+
+
+@dataclass(frozen=True)
+class MoveTable:
+    """
+    Legal single steps for every cell of a board of a given size.
+    Cells are indexed row-major: index = y * width + x.
+    """
+
+    width: int
+    height: int
+    masks: bytes = field(repr=False)
+    neighbours: Tuple[Tuple[int, ...], ...] = field(repr=False)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coords(self, cell: int) -> Tuple[int, int]:
+        y, x = divmod(cell, self.width)
+        return (x, y)
+
+    def is_legal(self, x: int, y: int, delta_x: int, delta_y: int) -> bool:
+        bit = _BITS.get((delta_x, delta_y))
+        if bit is None or not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self.masks[y * self.width + x] & bit)
+
+    def successors(
+        self, cells: Iterable[int], teleports: Optional[Dict[int, int]] = None
+    ) -> List[Tuple[int, ...]]:
+        """
+        Legal successor cells for each cell in cells.
+        Stepping onto a teleporter lands on its paired teleporter instead.
+        :param cells: cell indices
+        :param teleports: cell index -> destination cell index
+        :return: one tuple of successor cell indices per input cell
+        """
+        neighbours = self.neighbours
+        if not teleports:
+            return [neighbours[c] for c in cells]
+        return [
+            tuple(teleports.get(n, n) for n in neighbours[c]) for c in cells
+        ]
+
+    def successor_positions(
+        self,
+        positions: Sequence[Tuple[int, int]],
+        teleports: Optional[Dict[int, int]] = None,
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Same as successors, but takes and returns (x, y) pairs
+        """
+        width = self.width
+        cells = [y * width + x for x, y in positions]
+        return [
+            [divmod(n, width)[::-1] for n in succ]
+            for succ in self.successors(cells, teleports)
+        ]
+
+
+_tables: Dict[Tuple[int, int], MoveTable] = {}
+
+
+def _build(width: int, height: int) -> MoveTable:
+    masks = bytearray(width * height)
+    neighbours: List[Tuple[int, ...]] = []
+    for y in range(height):
+        for x in range(width):
+            mask = 0
+            cells = []
+            for bit, dx, dy in DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height:
+                    mask |= bit
+                    cells.append(ny * width + nx)
+            masks[y * width + x] = mask
+            neighbours.append(tuple(cells))
+    return MoveTable(width, height, bytes(masks), tuple(neighbours))
+
+
+def get_move_table(width: int, height: int) -> MoveTable:
+    """
+    Get the move table for a board size, building it on first use.
+    Tables are shared between all boards with the same dimensions.
+    """
+    key = (width, height)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = _build(width, height)
+    return table
@@ -0,0 +1,117 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from colorama import Fore, Style
+from game.board_handler import BoardHandler
+from game.bot_handler import BotHandler
+from game.models import Board
+
+
+@dataclass
+class BoardPlacement:
+    board_handler: BoardHandler
+    bot_handler: BotHandler
+    max_workers: int = 8
+    # Boards scoring within this fraction of the best are treated as equal
+    tie_tolerance: float = 0.1
+
+    def probe(self) -> List[Board]:
+        """
+        Fetch the current state of every listed board concurrently.
+        Boards that fail to load are left out.
+        """
+        boards = self.board_handler.list_boards() or []
+        if not boards:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            fresh = list(pool.map(self._get_board, boards))
+        return [b for b in fresh if b is not None]
+
+    def _get_board(self, board: Board) -> Optional[Board]:
+        try:
+            return self.board_handler.get_board(board.id)
+        except Exception:
+            return None
+
+    @staticmethod
+    def occupancy(board: Board) -> int:
+        return sum(1 for o in board.game_objects or [] if o.type == "BotGameObject")
+
+    @staticmethod
+    def score(board: Board, extra_bots: int = 0) -> float:
+        """
+        Expected points per second for one more bot on the board:
+        diamond points per cell, times moves per second, shared
+        between everyone already on it.
+        """
+        objects = board.game_objects or []
+        points = sum(
+            (d.properties.points or 1) if d.properties else 1
+            for d in objects
+            if d.type == "DiamondGameObject"
+        )
+        occupancy = BoardPlacement.occupancy(board)
+        density = points / max(board.width * board.height, 1)
+        moves_per_second = 1000 / max(board.minimum_delay_between_moves, 1)
+        return density * moves_per_second / (occupancy + extra_bots + 1)
+
+    def plan(self, tokens: List[str], boards: List[Board]) -> Dict[str, List[int]]:
+        """
+        Assign each bot to the board with the best score given the bots
+        placed before it. Near-equal boards are ordered by load, then
+        randomly, so that separate processes working from the same
+        snapshot do not all pick the same board. Each bot gets its
+        remaining boards as fallbacks, best first.
+        :return: token -> board ids to try in order
+        """
+        added = {b.id: 0 for b in boards}
+        plans: Dict[str, List[int]] = {}
+        for token in tokens:
+            if not boards:
+                plans[token] = []
+                continue
+            scores = {b.id: self.score(b, added[b.id]) for b in boards}
+            tie_break = {b.id: random.random() for b in boards}
+            cutoff = max(scores.values()) * (1 - self.tie_tolerance)
+
+            def key(b: Board):
+                near = scores[b.id] >= cutoff
+                return (
+                    not near,
+                    0 if near else -scores[b.id],
+                    self.occupancy(b) + added[b.id],
+                    tie_break[b.id],
+                )
+
+            ranked = sorted(boards, key=key)
+            added[ranked[0].id] += 1
+            plans[token] = [b.id for b in ranked]
+        return plans
+
+    def _join(self, token: str, board_ids: List[int]) -> Optional[int]:
+        for board_id in board_ids:
+            try:
+                if self.bot_handler.join(token, board_id):
+                    return board_id
+                reason = "join rejected"
+            except Exception as e:
+                reason = e
+            print(
+                Fore.YELLOW + Style.BRIGHT + "Warn:" + Style.RESET_ALL,
+                "Unable to join board {}: {}".format(board_id, reason),
+            )
+        return None
+
+    def place(self, tokens: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Spread a fleet of bots across the available boards.
+        Joins run in parallel; a bot whose join fails moves on to its
+        next-best board.
+        :return: token -> joined board id, or None if no board accepted it
+        """
+        plans = self.plan(tokens, self.probe())
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            joined = pool.map(lambda t: self._join(t, plans[t]), tokens)
+            return dict(zip(tokens, joined))
@@ -5,6 +5,7 @@ from colorama import Back, Fore, Style, init
 from game.api import Api
 from game.board_handler import BoardHandler
 from game.bot_handler import BotHandler
+from game.placement import BoardPlacement
 from game.logic.JamalKopling import GreedyJamalLogic
 from game.util import *
 from game.logic.base import BaseLogic
@@ -123,19 +124,9 @@ bot_logic: BaseLogic = logic_class()
 current_board_id = int(args.board)
 
 if not current_board_id:
-    # List active boards to find one we can join if we haven't specified one
-    boards = board_handler.list_boards()
-    for board in boards:
-        # Try to join board
-        board_joined = False
-        current_board_id = board.id
-        success = bot_handler.join(bot.id, current_board_id)
-        if success:
-            board_joined = True
-            break
-
-    if not board_joined:
-        exit()
+    # Probe all active boards and join the one with the best expected yield
+    placement = BoardPlacement(board_handler, bot_handler)
+    current_board_id = placement.place([bot.id])[bot.id]
 else:
     # Try to join the one we specified
     success = bot_handler.join(bot.id, current_board_id)